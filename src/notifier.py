@@ -2,12 +2,16 @@
 Telegram notification handler for the job tracker bot.
 """
 
+import html
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import requests
 
 from utils import get_logger
 
+# Telegram rejects messages longer than this many characters
+MAX_MESSAGE_LENGTH = 4096
+
 
 class TelegramNotifier:
     """
@@ -32,6 +36,10 @@ class TelegramNotifier:
             self.logger.info("Telegram notifier initialized successfully")
         
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage" if self.bot_token else None
+        
+        # Reuse one connection to the Bot API across all notifications
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
     
     def send_message(self, text: str, parse_mode: str = 'HTML') -> bool:
         """
@@ -45,7 +53,7 @@ class TelegramNotifier:
             True if message sent successfully, False otherwise
         """
         if not self.enabled:
-            self.logger.info(f"[NOTIFICATION DISABLED] Would send: {text}")
+            self.logger.info("[NOTIFICATION DISABLED] Would send: %s", text)
             return False
         
         try:
@@ -56,18 +64,18 @@ class TelegramNotifier:
                 'disable_web_page_preview': False
             }
             
-            response = requests.post(self.base_url, json=payload, timeout=10)
+            response = self.session.post(self.base_url, json=payload, timeout=10)
             response.raise_for_status()
             
             self.logger.info("Message sent successfully via Telegram")
             return True
         
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to send Telegram message: {e}")
+            self.logger.error("Failed to send Telegram message: %s", e)
             return False
         
         except Exception as e:
-            self.logger.error(f"Unexpected error sending Telegram message: {e}")
+            self.logger.error("Unexpected error sending Telegram message: %s", e)
             return False
     
     def send_job_notification(self, job: Dict[str, Any]) -> bool:
@@ -80,24 +88,82 @@ class TelegramNotifier:
         Returns:
             True if notification sent successfully, False otherwise
         """
+        return self.send_job_notifications([job])
+    
+    def _format_job_entry(self, job: Dict[str, Any], max_length: int) -> str:
+        """
+        Format a single job as an HTML digest entry.
+        
+        Args:
+            job: Dictionary containing job details
+            max_length: Maximum length of the entry; longer titles are shortened
+            
+        Returns:
+            HTML-escaped digest entry
+        """
+        company = html.escape(str(job.get('company', 'Unknown')), quote=False)
+        url = html.escape(str(job.get('url', '#')), quote=False)
+        title = str(job.get('title', 'Unknown'))
+        
+        def render(title: str) -> str:
+            return (
+                f"<b>Company:</b> {company}\n"
+                f"<b>Position:</b> {html.escape(title, quote=False)}\n"
+                f"<b>Apply here:</b> {url}"
+            )
+        
+        entry = render(title)
+        overflow = len(entry) - max_length
+        if overflow > 0:
+            # Each dropped character shortens the escaped title by at least one
+            entry = render(title[:max(len(title) - overflow - 1, 0)] + "…")
+            if len(entry) > max_length:
+                self.logger.warning("Job entry for %s is too long for a single Telegram message", company)
+        
+        return entry
+    
+    def send_job_notifications(self, jobs: List[Dict[str, Any]]) -> bool:
+        """
+        Format and send a single digest message for several new jobs.
+        
+        The digest is split across several messages only if it would exceed
+        Telegram's message length limit.
+        
+        Args:
+            jobs: List of dictionaries containing job details
+            
+        Returns:
+            True if all digest messages were sent successfully, False otherwise
+        """
+        if not jobs:
+            return True
+        
         try:
-            # Format message with HTML
-            message = f"""
-🎯 <b>New Project Manager Position!</b>
-
-<b>Company:</b> {job.get('company', 'Unknown')}
-<b>Position:</b> {job.get('title', 'Unknown')}
-<b>Discovered:</b> {job.get('first_seen', 'Unknown')}
-
-<b>Apply here:</b> {job.get('url', '#')}
-
-#ProjectManager #JobAlert
-"""
+            plural = "s" if len(jobs) != 1 else ""
+            header = f"🎯 <b>{len(jobs)} New Project Manager Position{plural}!</b>"
+            footer = "#ProjectManager #JobAlert"
             
-            return self.send_message(message.strip())
+            max_entry_length = MAX_MESSAGE_LENGTH - len(header) - len(footer) - 4
+            
+            messages = []
+            current = header
+            for job in jobs:
+                entry = self._format_job_entry(job, max_entry_length)
+                
+                # Start a new message if this entry would push us over the limit
+                if current != header and len(current) + len(entry) + len(footer) + 4 > MAX_MESSAGE_LENGTH:
+                    messages.append(f"{current}\n\n{footer}")
+                    current = entry
+                else:
+                    current = f"{current}\n\n{entry}"
+            
+            messages.append(f"{current}\n\n{footer}")
+            
+            results = [self.send_message(message) for message in messages]
+            return all(results)
         
         except Exception as e:
-            self.logger.error(f"Error formatting job notification: {e}")
+            self.logger.error("Error sending job digest: %s", e)
             return False
     
     def send_summary(self, new_jobs_count: int, total_jobs_count: int, errors: int = 0) -> bool:
@@ -114,8 +180,8 @@ class TelegramNotifier:
         """
         if not self.enabled:
             self.logger.info(
-                f"[SUMMARY] New jobs: {new_jobs_count}, "
-                f"Total jobs: {total_jobs_count}, Errors: {errors}"
+                "[SUMMARY] New jobs: %s, Total jobs: %s, Errors: %s",
+                new_jobs_count, total_jobs_count, errors
             )
             return False
         
@@ -138,7 +204,7 @@ class TelegramNotifier:
             return self.send_message(message.strip())
         
         except Exception as e:
-            self.logger.error(f"Error sending summary: {e}")
+            self.logger.error("Error sending summary: %s", e)
             return False
     
     def send_error_notification(self, error_message: str) -> bool:
@@ -161,5 +227,5 @@ class TelegramNotifier:
             return self.send_message(message.strip())
         
         except Exception as e:
-            self.logger.error(f"Error sending error notification: {e}")
+            self.logger.error("Error sending error notification: %s", e)
             return False
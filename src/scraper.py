@@ -2,19 +2,54 @@
 Job scraper for tracking Project Manager positions.
 """
 
+import queue
+import re
+import socket
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Set
-from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import urlparse
 import traceback
 
-import pandas as pd
+import openpyxl
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import lxml.html
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
 
 from utils import get_logger, load_config, load_job_database, save_job_database
 from notifier import TelegramNotifier
 
+# Matches a <meta charset=...> or <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+
+class CappedRetry(Retry):
+    """
+    Retry policy that never waits longer than max_retry_after seconds for a Retry-After header.
+    """
+    
+    def __init__(self, *args: Any, max_retry_after: float = 60, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+    
+    def new(self, **kw: Any) -> "CappedRetry":
+        # urllib3 creates a fresh Retry after every attempt; carry the cap over
+        retry = super().new(**kw)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+    
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
 
 class JobScraper:
     """
@@ -33,13 +68,72 @@ class JobScraper:
         self.notifier = TelegramNotifier()
         self.session = requests.Session()
         
+        # HTTP validators and candidate job links per career page URL, persisted in the database
+        self.page_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Resolve settings once instead of on every request
+        scraping_config = self.config.get('scraping', {})
+        self._timeout = scraping_config.get('timeout', 10)
+        self._retry_attempts = scraping_config.get('retry_attempts', 3)
+        self._retry_delay = scraping_config.get('retry_delay', 2)
+        self._request_delay = scraping_config.get('request_delay', 2)
+        self._max_workers = scraping_config.get('max_workers', 8)
+        self._max_page_bytes = scraping_config.get('max_page_bytes', 2_000_000)
+        self._max_notifications = self.config.get('notifications', {}).get('max_jobs_per_notification', 10)
+        
         # Configure session with user agent
-        user_agent = self.config.get('scraping', {}).get(
+        user_agent = scraping_config.get(
             'user_agent',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         )
         self.session.headers.update({'User-Agent': user_agent})
         
+        # Retry transient failures with exponential backoff. urllib3 retries the first
+        # failure immediately and then waits retry_delay * 2**(n-1) before retry n, so
+        # the longest backoff is retry_delay * 2**(retry_attempts-2). Retry-After is
+        # honoured only up to that (and at least retry_delay) seconds.
+        longest_backoff = self._retry_delay * 2 ** max(self._retry_attempts - 2, 0)
+        retry = CappedRetry(
+            total=max(self._retry_attempts - 1, 0),
+            backoff_factor=self._retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            max_retry_after=max(longest_backoff, self._retry_delay)
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Look for common job posting elements
+        # This is a generic approach - different sites structure their HTML differently
+        selectors = [
+            'a[href*="job"]',
+            'a[href*="career"]',
+            'a[href*="position"]',
+            'a.job-title',
+            'a.career-link',
+            '[class*="job"] a',
+            '[class*="career"] a',
+            '[class*="position"] a'
+        ]
+        # Combined into one selector so the page is only traversed once
+        self._combined_selector = ', '.join(selectors)
+        self._job_link_selector = CSSSelector(self._combined_selector)
+        
+        # Compile keywords once into a single case-insensitive pattern
+        search_keywords = [
+            str(keyword) for keyword in self.config.get('search_keywords', []) if str(keyword).strip()
+        ]
+        self._keyword_re = re.compile(
+            '|'.join(re.escape(keyword) for keyword in search_keywords),
+            re.IGNORECASE
+        ) if search_keywords else None
+        
+        # Cheap pre-checks: any match is at least as long as the shortest keyword
+        # and contains the last word of some keyword
+        self._min_keyword_length = min((len(keyword) for keyword in search_keywords), default=0)
+        self._fast_needles = tuple({keyword.lower().split()[-1] for keyword in search_keywords})
+        
         self.logger.info("JobScraper initialized")
     
     def scrape_website(self, url: str, company_name: str) -> List[Dict[str, Any]]:
@@ -53,124 +147,248 @@ class JobScraper:
         Returns:
             List of job dictionaries found on the website
         """
-        self.logger.info(f"Scraping {company_name}: {url}")
+        self.logger.info("Scraping %s: %s", company_name, url)
         
         jobs = []
-        scraping_config = self.config.get('scraping', {})
-        timeout = scraping_config.get('timeout', 10)
-        retry_attempts = scraping_config.get('retry_attempts', 3)
-        retry_delay = scraping_config.get('retry_delay', 2)
         
-        for attempt in range(retry_attempts):
-            try:
-                response = self.session.get(url, timeout=timeout)
+        # Ask the server to skip the page if it hasn't changed since the last scrape
+        cached_page = self.page_cache.get(url, {})
+        headers = {}
+        if cached_page.get('etag'):
+            headers['If-None-Match'] = cached_page['etag']
+        if cached_page.get('last_modified'):
+            headers['If-Modified-Since'] = cached_page['last_modified']
+        
+        try:
+            with self.session.get(url, headers=headers, stream=True, timeout=self._timeout) as response:
                 response.raise_for_status()
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Search for job postings
-                jobs = self._extract_jobs(soup, url, company_name)
-                
-                self.logger.info(f"Found {len(jobs)} potential jobs at {company_name}")
+                body = b'' if response.status_code == 304 else self._read_body(response, company_name)
+            
+            if response.status_code == 304:
+                # Re-filter the cached links so keyword changes still apply to unchanged pages
+                links = {(href, title) for href, title in cached_page.get('links', [])}
+                jobs = self._filter_jobs(links, company_name)
+                self.logger.info(
+                    "%s unchanged since last scrape, found %s potential jobs in cached links",
+                    company_name, len(jobs)
+                )
                 return jobs
             
-            except requests.exceptions.Timeout:
+            # Only trust the charset if the server actually declared one
+            content_type = response.headers.get('Content-Type', '')
+            encoding = response.encoding if 'charset' in content_type.lower() else None
+            
+            # Search for job postings
+            links = self._extract_links(body, url, encoding)
+            jobs = self._filter_jobs(links, company_name)
+            
+            # Remember validators so the next run can send a conditional request
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.page_cache[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'links': sorted(links)
+                }
+            else:
+                self.page_cache.pop(url, None)
+            
+            self.logger.info("Found %s potential jobs at %s", len(jobs), company_name)
+            return jobs
+        
+        except requests.exceptions.Timeout:
+            self.logger.warning(
+                "Timeout scraping %s after %s attempts",
+                company_name, self._retry_attempts
+            )
+        
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Error scraping %s: %s", company_name, e)
+        
+        except Exception as e:
+            self.logger.error(
+                "Unexpected error scraping %s: %s\n%s",
+                company_name, e, traceback.format_exc()
+            )
+        
+        return jobs
+    
+    def _read_body(self, response: requests.Response, company_name: str) -> bytes:
+        """
+        Read a streamed response body, stopping once the configured size cap is reached.
+        
+        Args:
+            response: Streamed response to read from
+            company_name: Name of the company, used for logging
+            
+        Returns:
+            Response body, truncated to at most max_page_bytes
+        """
+        max_page_bytes = self._max_page_bytes
+        body = bytearray()
+        
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) >= max_page_bytes:
                 self.logger.warning(
-                    f"Timeout scraping {company_name} (attempt {attempt + 1}/{retry_attempts})"
-                )
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.error(
-                    f"Error scraping {company_name} (attempt {attempt + 1}/{retry_attempts}): {e}"
-                )
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Unexpected error scraping {company_name}: {e}\n{traceback.format_exc()}"
+                    "Page for %s exceeds %s bytes, parsing only the first %s bytes",
+                    company_name, max_page_bytes, max_page_bytes
                 )
                 break
-            
-            # Exponential backoff for retries
-            if attempt < retry_attempts - 1:
-                wait_time = retry_delay * (2 ** attempt)
-                self.logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
         
-        return jobs
+        return bytes(body[:max_page_bytes])
     
-    def _extract_jobs(self, soup: BeautifulSoup, base_url: str, company_name: str) -> List[Dict[str, Any]]:
+    def _extract_links(self, body: bytes, base_url: str,
+                       encoding: Optional[str] = None) -> Set[Tuple[str, str]]:
         """
-        Extract job postings from parsed HTML.
+        Extract candidate job links from raw HTML.
         
         Args:
-            soup: BeautifulSoup object containing parsed HTML
+            body: Raw HTML of the career page
             base_url: Base URL of the website
+            encoding: Character encoding declared by the server, if any
+            
+        Returns:
+            Set of (absolute URL, link text) tuples
+        """
+        links = set()
+        
+        parser = None
+        if encoding is not None:
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                # The server declared a charset lxml doesn't know, so detect it ourselves
+                self.logger.warning("Ignoring unknown charset %r for %s", encoding, base_url)
+        
+        # Without a usable declared charset, let lxml read <meta charset> and otherwise assume UTF-8
+        if parser is None:
+            detected = None if META_CHARSET_RE.search(body[:2048]) else 'utf-8'
+            parser = lxml.html.HTMLParser(encoding=detected)
+        
+        try:
+            tree = lxml.html.fromstring(body, parser=parser)
+        except ParserError:
+            # Empty page, or nothing but whitespace and comments
+            return links
+        
+        # Make all URLs absolute in a single pass
+        tree.make_links_absolute(base_url, handle_failures='ignore')
+        
+        for element in self._job_link_selector(tree):
+            href = element.get('href')
+            if href:
+                title = ' '.join(element.text_content().split())
+                links.add((href, title))
+        
+        return links
+    
+    def _filter_jobs(self, links: Set[Tuple[str, str]], company_name: str) -> List[Dict[str, Any]]:
+        """
+        Turn candidate links whose text matches the search keywords into jobs.
+        
+        Args:
+            links: Set of (absolute URL, link text) tuples
             company_name: Name of the company
             
         Returns:
             List of job dictionaries
         """
         jobs = []
-        search_keywords = self.config.get('search_keywords', [])
-        
-        # Look for common job posting elements
-        # This is a generic approach - different sites structure their HTML differently
-        selectors = [
-            'a[href*="job"]',
-            'a[href*="career"]',
-            'a[href*="position"]',
-            'a.job-title',
-            'a.career-link',
-            '[class*="job"] a',
-            '[class*="career"] a',
-            '[class*="position"] a'
-        ]
-        
-        links = set()
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href')
-                if href:
-                    # Make URL absolute
-                    full_url = urljoin(base_url, href)
-                    links.add((full_url, element.get_text(strip=True)))
         
         # Filter by keywords
+        now = datetime.utcnow().isoformat()
         for url, title in links:
-            if self._matches_keywords(title, search_keywords):
+            if self._matches_keywords(title):
                 job = {
                     'company': company_name,
                     'title': title,
                     'url': url,
-                    'first_seen': datetime.utcnow().isoformat(),
-                    'last_seen': datetime.utcnow().isoformat()
+                    'first_seen': now,
+                    'last_seen': now
                 }
                 jobs.append(job)
         
         return jobs
     
-    def _matches_keywords(self, text: str, keywords: List[str]) -> bool:
+    def _matches_keywords(self, text: str) -> bool:
         """
         Check if text contains any of the search keywords.
         
         Args:
             text: Text to search in
-            keywords: List of keywords to search for
             
         Returns:
             True if any keyword is found, False otherwise
         """
-        if not text:
+        if not text or self._keyword_re is None or len(text) < self._min_keyword_length:
             return False
         
+        # Rule out most navigation links ("Home", "About us") before running the regex
         text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
+        if not any(needle in text_lower for needle in self._fast_needles):
+            return False
         
-        return False
+        return self._keyword_re.search(text) is not None
+    
+    def _prewarm_dns(self, hosts: Set[str]) -> None:
+        """
+        Start resolving all host names in the background.
+        
+        Lookups run on daemon threads that are never joined, so neither the scrape nor
+        process exit waits on a slow resolver. This only helps when the machine has a
+        caching resolver (e.g. systemd-resolved or nscd, as on GitHub's Ubuntu runners):
+        workers that reach a host later in the queue then find its address cached.
+        Without one, each worker repeats the lookup and the prewarm is wasted work.
+        
+        Args:
+            hosts: Host names to resolve
+        """
+        if not hosts:
+            return
+        
+        pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        for host in hosts:
+            pending.put(host)
+        
+        def resolve_pending() -> None:
+            while True:
+                try:
+                    host = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+                except OSError:
+                    # Unresolvable hosts are reported by the scrape itself
+                    pass
+        
+        for _ in range(min(32, len(hosts))):
+            threading.Thread(target=resolve_pending, daemon=True).start()
+    
+    def _scrape_host(self, host: str, companies: List[Tuple[int, str, str]]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Scrape all companies hosted on the same site, one request at a time.
+        
+        Args:
+            host: Host name shared by the career websites
+            companies: List of (row index, company name, URL) tuples for this host
+            
+        Returns:
+            Dictionary mapping row index to the jobs found for that company
+        """
+        results = {}
+        
+        for position, (idx, company_name, url) in enumerate(companies):
+            results[idx] = self.scrape_website(url, company_name)
+            
+            # Be respectful - delay between requests to the same host
+            if position < len(companies) - 1:
+                self.logger.info("Waiting %s seconds before next request to %s...", self._request_delay, host)
+                time.sleep(self._request_delay)
+        
+        return results
     
     def process_companies(self, excel_path: str = "companies.xlsx") -> List[Dict[str, Any]]:
         """
@@ -182,40 +400,86 @@ class JobScraper:
         Returns:
             List of all jobs found
         """
-        self.logger.info(f"Processing companies from {excel_path}")
+        self.logger.info("Processing companies from %s", excel_path)
         
         try:
-            df = pd.read_excel(excel_path)
-            self.logger.info(f"Loaded {len(df)} companies from Excel")
+            workbook = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+            try:
+                rows = list(workbook.active.iter_rows(values_only=True))
+            finally:
+                workbook.close()
             
-            all_jobs = []
-            request_delay = self.config.get('scraping', {}).get('request_delay', 2)
+            header = rows[0] if rows else ()
+            if 'Company Name' not in header or 'Career Website URL' not in header:
+                self.logger.error(
+                    "Excel file %s must have 'Company Name' and 'Career Website URL' columns",
+                    excel_path
+                )
+                return []
+            
+            name_col = header.index('Company Name')
+            url_col = header.index('Career Website URL')
             
-            for idx, row in df.iterrows():
-                company_name = row.get('Company Name', 'Unknown')
-                url = row.get('Career Website URL', '')
+            # Skip completely blank rows
+            companies = [row for row in rows[1:] if any(cell is not None for cell in row)]
+            self.logger.info("Loaded %s companies from Excel", len(companies))
+            
+            # Group companies by host so each site is only hit by one worker at a time
+            companies_by_host: Dict[str, List[Tuple[int, str, str]]] = defaultdict(list)
+            for idx, row in enumerate(companies):
+                # Read-only sheets without a <dimension> element return ragged rows
+                name = row[name_col] if name_col < len(row) else None
+                url = row[url_col] if url_col < len(row) else None
+                company_name = str(name) if name is not None else 'Unknown'
+                url = str(url) if url is not None else ''
                 
                 if not url:
-                    self.logger.warning(f"Skipping {company_name}: No URL provided")
+                    self.logger.warning("Skipping %s: No URL provided", company_name)
                     continue
                 
-                jobs = self.scrape_website(url, company_name)
-                all_jobs.extend(jobs)
+                companies_by_host[urlparse(url).netloc].append((idx, company_name, url))
+            
+            # Forget cached pages that are no longer in the spreadsheet
+            current_urls = {url for companies in companies_by_host.values() for _, _, url in companies}
+            for cached_url in set(self.page_cache) - current_urls:
+                del self.page_cache[cached_url]
+            
+            hostnames = {
+                urlparse(url).hostname
+                for companies in companies_by_host.values()
+                for _, _, url in companies
+            }
+            hostnames.discard(None)
+            self._prewarm_dns(hostnames)
+            
+            results: Dict[int, List[Dict[str, Any]]] = {}
+            
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = {
+                    executor.submit(self._scrape_host, host, companies): host
+                    for host, companies in companies_by_host.items()
+                }
                 
-                # Be respectful - delay between requests
-                if idx < len(df) - 1:
-                    self.logger.info(f"Waiting {request_delay} seconds before next request...")
-                    time.sleep(request_delay)
+                for future in as_completed(futures):
+                    try:
+                        results.update(future.result())
+                    except Exception as e:
+                        self.logger.error("Error scraping host %s: %s", futures[future], e)
             
-            self.logger.info(f"Total jobs found across all companies: {len(all_jobs)}")
+            # Keep the spreadsheet order regardless of completion order
+            all_jobs = []
+            for idx in sorted(results):
+                all_jobs.extend(results[idx])
+            
+            self.logger.info("Total jobs found across all companies: %s", len(all_jobs))
             return all_jobs
         
         except FileNotFoundError:
-            self.logger.error(f"Excel file not found: {excel_path}")
+            self.logger.error("Excel file not found: %s", excel_path)
             return []
         
         except Exception as e:
-            self.logger.error(f"Error processing companies: {e}\n{traceback.format_exc()}")
+            self.logger.error("Error processing companies: %s\n%s", e, traceback.format_exc())
             return []
     
     def identify_new_jobs(self, current_jobs: List[Dict[str, Any]], database: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -231,19 +495,20 @@ class JobScraper:
         """
         new_jobs = []
         existing_jobs = database.get('jobs', {})
+        now = datetime.utcnow().isoformat()
         
         for job in current_jobs:
-            # Create unique key from company + URL
-            job_key = f"{job['company']}||{job['url']}"
+            # Jobs are uniquely identified by company + URL
+            job_key = (job['company'], job['url'])
             
             if job_key not in existing_jobs:
                 new_jobs.append(job)
-                self.logger.info(f"New job: {job['title']} at {job['company']}")
+                self.logger.info("New job: %s at %s", job['title'], job['company'])
             else:
                 # Update last_seen timestamp for existing job
-                existing_jobs[job_key]['last_seen'] = datetime.utcnow().isoformat()
+                existing_jobs[job_key]['last_seen'] = now
         
-        self.logger.info(f"Identified {len(new_jobs)} new jobs")
+        self.logger.info("Identified %s new jobs", len(new_jobs))
         return new_jobs
     
     def update_database(self, new_jobs: List[Dict[str, Any]], database: Dict[str, Any]) -> Dict[str, Any]:
@@ -261,7 +526,7 @@ class JobScraper:
             database['jobs'] = {}
         
         for job in new_jobs:
-            job_key = f"{job['company']}||{job['url']}"
+            job_key = (job['company'], job['url'])
             database['jobs'][job_key] = job
         
         return database
@@ -294,6 +559,7 @@ class JobScraper:
         try:
             # Load existing database
             database = load_job_database(db_path)
+            self.page_cache = database.setdefault('pages', {})
             
             # Scrape all companies
             current_jobs = self.process_companies(excel_path)
@@ -310,19 +576,15 @@ class JobScraper:
             # Save database
             save_job_database(database, db_path)
             
-            # Send notifications for new jobs
-            max_notifications = self.config.get('notifications', {}).get('max_jobs_per_notification', 10)
+            # Send one digest notification for the new jobs
+            if len(new_jobs) > self._max_notifications:
+                self.logger.info(
+                    "Reached max notifications limit (%s), skipping remaining %s jobs",
+                    self._max_notifications, len(new_jobs) - self._max_notifications
+                )
             
-            for idx, job in enumerate(new_jobs):
-                if idx >= max_notifications:
-                    self.logger.info(
-                        f"Reached max notifications limit ({max_notifications}), "
-                        f"skipping remaining {len(new_jobs) - idx} jobs"
-                    )
-                    break
-                
-                self.notifier.send_job_notification(job)
-                time.sleep(1)  # Small delay between notifications
+            if new_jobs:
+                self.notifier.send_job_notifications(new_jobs[:self._max_notifications])
             
             # Update stats
             stats['new_jobs'] = len(new_jobs)
@@ -337,12 +599,12 @@ class JobScraper:
                 )
             
             self.logger.info("=" * 60)
-            self.logger.info(f"Job Tracker Bot Completed")
-            self.logger.info(f"New jobs: {stats['new_jobs']}, Total jobs: {stats['total_jobs']}")
+            self.logger.info("Job Tracker Bot Completed")
+            self.logger.info("New jobs: %s, Total jobs: %s", stats['new_jobs'], stats['total_jobs'])
             self.logger.info("=" * 60)
             
         except Exception as e:
-            self.logger.error(f"Critical error in run: {e}\n{traceback.format_exc()}")
+            self.logger.error("Critical error in run: %s\n%s", e, traceback.format_exc())
             stats['errors'] = 1
             self.notifier.send_error_notification(f"Critical error: {str(e)}")
         
@@ -2,52 +2,48 @@
 Utility functions for the job tracker bot.
 """
 
-import json
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
 import yaml
 
 
+# Configure the root logger once, when the utilities are first imported.
+# The scripts are run directly (python src/scraper.py), so src/__init__.py never executes.
+if not logging.getLogger().hasHandlers():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        stream=sys.stdout
+    )
+
+
 def get_logger(name: str) -> logging.Logger:
     """
-    Configure and return a logger with the specified name.
+    Return a logger with the specified name.
     
     Args:
         name: Name of the logger
         
     Returns:
-        Configured logger instance
+        Logger instance using the shared root configuration
     """
-    logger = logging.getLogger(name)
-    
-    # Only add handler if logger doesn't have one
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        logger.addHandler(handler)
-    
-    return logger
+    return logging.getLogger(name)
 
 
+@lru_cache(maxsize=None)
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
     Load YAML configuration file with defaults.
     
+    Results are cached per path, so the file is only read once per process.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -59,17 +55,17 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     try:
         config_file = Path(config_path)
         if not config_file.exists():
-            logger.warning(f"Config file {config_path} not found, using defaults")
+            logger.warning("Config file %s not found, using defaults", config_path)
             return get_default_config()
         
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
         
-        logger.info(f"Configuration loaded from {config_path}")
+        logger.info("Configuration loaded from %s", config_path)
         return config
     
     except Exception as e:
-        logger.error(f"Error loading config: {e}")
+        logger.error("Error loading config: %s", e)
         logger.info("Using default configuration")
         return get_default_config()
 
@@ -97,6 +93,8 @@ def get_default_config() -> Dict[str, Any]:
             'retry_attempts': 3,
             'retry_delay': 2,
             'request_delay': 2,
+            'max_workers': 8,
+            'max_page_bytes': 2000000,
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         },
         'notifications': {
@@ -126,22 +124,32 @@ def load_job_database(db_path: str = "jobs_database.json") -> Dict[str, Any]:
     try:
         db_file = Path(db_path)
         if not db_file.exists():
-            logger.info(f"Database file {db_path} not found, creating new database")
+            logger.info("Database file %s not found, creating new database", db_path)
             return {'jobs': {}, 'metadata': {'last_updated': None, 'total_jobs': 0}}
         
-        with open(db_path, 'r', encoding='utf-8') as f:
-            database = json.load(f)
+        with open(db_path, 'rb') as f:
+            database = orjson.loads(f.read())
+        
+        # Jobs are keyed by (company, url) in memory and "company||url" on disk
+        jobs = {}
+        for key, job in database.get('jobs', {}).items():
+            company, separator, url = key.partition('||')
+            if not separator:
+                logger.warning("Skipping malformed job entry: %s", key)
+                continue
+            jobs[(company, url)] = job
+        database['jobs'] = jobs
         
-        logger.info(f"Loaded {len(database.get('jobs', {}))} jobs from database")
+        logger.info("Loaded %s jobs from database", len(database.get('jobs', {})))
         return database
     
-    except json.JSONDecodeError as e:
-        logger.error(f"Error parsing JSON database: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Error parsing JSON database: %s", e)
         logger.info("Creating new database")
         return {'jobs': {}, 'metadata': {'last_updated': None, 'total_jobs': 0}}
     
     except Exception as e:
-        logger.error(f"Error loading database: {e}")
+        logger.error("Error loading database: %s", e)
         logger.info("Creating new database")
         return {'jobs': {}, 'metadata': {'last_updated': None, 'total_jobs': 0}}
 
@@ -168,13 +176,24 @@ def save_job_database(database: Dict[str, Any], db_path: str = "jobs_database.js
         database['metadata']['last_updated'] = datetime.utcnow().isoformat()
         database['metadata']['total_jobs'] = len(database.get('jobs', {}))
         
-        # Save to file
-        with open(db_path, 'w', encoding='utf-8') as f:
-            json.dump(database, f, indent=2, ensure_ascii=False)
+        # JSON object keys must be strings
+        serializable = dict(database)
+        serializable['jobs'] = {
+            f"{company}||{url}": job
+            for (company, url), job in database.get('jobs', {}).items()
+        }
+        
+        # Write to a temporary file and swap it in, so a crash never leaves a half-written database
+        tmp_path = f"{db_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, db_path)
         
-        logger.info(f"Database saved successfully to {db_path}")
+        logger.info("Database saved successfully to %s", db_path)
         return True
     
     except Exception as e:
-        logger.error(f"Error saving database: {e}")
+        logger.error("Error saving database: %s", e)
         return False